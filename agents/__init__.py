@@ -2,5 +2,14 @@
 Multi-Agent Ecosystem for Autonomous Python Development
 """
 
+import logging
+
+# One root-level handler for every agent logger; child loggers propagate
+# instead of each carrying (and locking) a private StreamHandler
+logging.basicConfig(
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    level=logging.INFO
+)
+
 __version__ = "1.0.0"
 __author__ = "AI Agent Ecosystem Builder"
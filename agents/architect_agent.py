@@ -3,10 +3,17 @@ Architect Agent - Designs system architecture and modules
 """
 
 import os
-import json
+import re
+import orjson
 from typing import Dict, Any, List, Optional
 from .base_agent import BaseAgent
 
+# Compiled once; scanning the whole response beats a Python-level line
+# loop. Leading whitespace is allowed because the old parser stripped
+# each line first, and LLM markdown routinely indents nested bullets
+_MODULE_HEADER_RE = re.compile(r'^[ \t]*(?:Module:|##)\s*(.+?)\s*$', re.MULTILINE)
+_BULLET_RE = re.compile(r'^[ \t]*[-*]\s*(.+?)\s*$', re.MULTILINE)
+
 class ArchitectAgent(BaseAgent):
     """Agent responsible for system architecture design"""
     
@@ -36,14 +43,21 @@ class ArchitectAgent(BaseAgent):
                 }
                 self.logger.info("No specific requirements found, using default architecture")
             
-            # Design architecture
-            architecture = self._design_architecture(requirements)
-            
-            # Create module structure
-            modules = self._design_modules(architecture)
-            
-            # Identify dependencies
-            dependencies = self._identify_dependencies(modules)
+            # Design architecture, modules and dependencies in one LLM
+            # round-trip; fall back to the per-step calls if that fails
+            design = self._design_all(requirements)
+            if design:
+                architecture = design["architecture"]
+                modules = design["modules"]
+                dependencies = design["dependencies"]
+            else:
+                architecture = self._design_architecture(requirements)
+                # Serialize each payload once and hand the string down so
+                # the prompt builders skip their own dumps
+                architecture_json = orjson.dumps(architecture).decode()
+                modules = self._design_modules(architecture, architecture_json)
+                modules_json = orjson.dumps(modules).decode()
+                dependencies = self._identify_dependencies(modules, modules_json)
             
             # Save architecture to file
             self._save_architecture(architecture, modules, dependencies)
@@ -63,6 +77,70 @@ class ArchitectAgent(BaseAgent):
             self.logger.error(f"Architecture design failed: {str(e)}")
             return self.create_response(False, f"Architecture design failed: {str(e)}")
     
+    def _design_all(self, requirements: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Design architecture, modules and dependencies in a single LLM call"""
+        try:
+            # Minimal requirements get the default design without any LLM call
+            if not requirements.get("user_description") or len(requirements.get("user_description", "").strip()) < 10:
+                return {
+                    "architecture": self._create_default_architecture(),
+                    "modules": self._create_default_modules(),
+                    "dependencies": []
+                }
+
+            messages = [
+                {
+                    "role": "system",
+                    "content": """You are a Software Architect designing a Python application. Based on the requirements, produce in one pass:
+
+1. The system architecture (overview, components, data flow, technology stack, scalability, security)
+2. The Python module structure (name, description, responsibilities, classes, functions per module)
+3. All external Python package dependencies
+
+Return a single JSON object with "architecture", "modules" and "dependencies" keys."""
+                },
+                {
+                    "role": "user",
+                    "content": f"Design the application for: {orjson.dumps(requirements).decode()}"
+                }
+            ]
+
+            response_format = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "application_design",
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "architecture": {"type": "object"},
+                            "modules": {
+                                "type": "array",
+                                "items": {"type": "object"}
+                            },
+                            "dependencies": {
+                                "type": "array",
+                                "items": {"type": "string"}
+                            }
+                        },
+                        "required": ["architecture", "modules", "dependencies"]
+                    }
+                }
+            }
+
+            response = self.call_llm(
+                messages, response_format=response_format, semantic_cache=True
+            )
+            design = orjson.loads(response)
+
+            if not all(key in design for key in ("architecture", "modules", "dependencies")):
+                return None
+
+            return design
+
+        except Exception as e:
+            self.logger.error(f"Combined design call failed, falling back to per-step calls: {str(e)}")
+            return None
+
     def _design_architecture(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
         """Design the system architecture"""
         try:
@@ -86,16 +164,16 @@ Return the architecture as a structured JSON object."""
                 },
                 {
                     "role": "user",
-                    "content": f"Design architecture for: {json.dumps(requirements, indent=2)}"
+                    "content": f"Design architecture for: {orjson.dumps(requirements).decode()}"
                 }
             ]
             
-            response = self.call_llm(messages)
-            
+            response = self.call_llm(messages, semantic_cache=True)
+
             # Try to parse JSON response
             try:
-                architecture = json.loads(response)
-            except json.JSONDecodeError:
+                architecture = orjson.loads(response)
+            except orjson.JSONDecodeError:
                 # If not JSON, create structured architecture
                 architecture = {
                     "overview": response,
@@ -135,13 +213,17 @@ Return the architecture as a structured JSON object."""
             "security": "Basic input validation and error handling"
         }
     
-    def _design_modules(self, architecture: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _design_modules(self, architecture: Dict[str, Any],
+                        architecture_json: Optional[str] = None) -> List[Dict[str, Any]]:
         """Design module structure"""
         try:
             # Create default modules if architecture is basic
             if not architecture.get("components") or len(architecture.get("components", [])) < 2:
                 return self._create_default_modules()
             
+            if architecture_json is None:
+                architecture_json = orjson.dumps(architecture).decode()
+            
             messages = [
                 {
                     "role": "system",
@@ -157,12 +239,12 @@ Return as a list of module specifications."""
                 },
                 {
                     "role": "user",
-                    "content": f"Design modules for architecture: {json.dumps(architecture, indent=2)}"
+                    "content": f"Design modules for architecture: {architecture_json}"
                 }
             ]
             
-            response = self.call_llm(messages)
-            
+            response = self.call_llm(messages, semantic_cache=True)
+
             # Parse modules from response
             modules = self._parse_modules_from_response(response)
             return modules
@@ -194,28 +276,25 @@ Return as a list of module specifications."""
         """Parse modules from LLM response"""
         # This is a simplified parser - in practice, you'd want more robust parsing
         modules = []
-        lines = response.split('\n')
-        current_module = {}
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('Module:') or line.startswith('##'):
-                if current_module:
-                    modules.append(current_module)
-                current_module = {"name": line.replace('Module:', '').replace('##', '').strip()}
-            elif line.startswith('-') or line.startswith('*'):
-                if 'description' not in current_module:
-                    current_module['description'] = []
-                current_module['description'].append(line[1:].strip())
-        
-        if current_module:
-            modules.append(current_module)
-        
+        headers = list(_MODULE_HEADER_RE.finditer(response))
+
+        for i, header in enumerate(headers):
+            section_end = headers[i + 1].start() if i + 1 < len(headers) else len(response)
+            module = {"name": header.group(1)}
+            bullets = _BULLET_RE.findall(response, header.end(), section_end)
+            if bullets:
+                module["description"] = bullets
+            modules.append(module)
+
         return modules
     
-    def _identify_dependencies(self, modules: List[Dict[str, Any]]) -> List[str]:
+    def _identify_dependencies(self, modules: List[Dict[str, Any]],
+                               modules_json: Optional[str] = None) -> List[str]:
         """Identify external dependencies"""
         try:
+            if modules_json is None:
+                modules_json = orjson.dumps(modules).decode()
+            
             messages = [
                 {
                     "role": "system",
@@ -223,12 +302,12 @@ Return as a list of module specifications."""
                 },
                 {
                     "role": "user",
-                    "content": f"Identify dependencies for modules: {json.dumps(modules, indent=2)}"
+                    "content": f"Identify dependencies for modules: {modules_json}"
                 }
             ]
             
-            response = self.call_llm(messages)
-            
+            response = self.call_llm(messages, semantic_cache=True)
+
             # Parse dependencies from response
             dependencies = [line.strip() for line in response.split('\n') if line.strip()]
             return dependencies
@@ -248,8 +327,8 @@ Return as a list of module specifications."""
             }
             
             os.makedirs("project_docs", exist_ok=True)
-            with open("project_docs/architecture.json", "w") as f:
-                json.dump(arch_data, f, indent=2)
+            with open("project_docs/architecture.json", "wb") as f:
+                f.write(orjson.dumps(arch_data, option=orjson.OPT_INDENT_2))
             
             self.logger.info("Architecture saved to project_docs/architecture.json")
             
@@ -3,12 +3,25 @@ Backup & Version Control Agent - Manages backups and version control
 """
 
 import os
+import heapq
 import shutil
-import json
+import orjson
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from typing import Dict, Any, List, Optional
 from .base_agent import BaseAgent
 
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; _fast_copy falls back to shutil
+    fcntl = None
+
+# Linux FICLONE ioctl - O(1) reflink copies on Btrfs/XFS/ZFS
+_FICLONE = 0x40049409
+
 class BackupAgent(BaseAgent):
     """Agent responsible for backup and version control"""
     
@@ -39,7 +52,11 @@ class BackupAgent(BaseAgent):
             
             # Create backup
             backup_path = self._create_backup(files_to_backup)
-            
+
+            # Merge the persisted history before appending, so pruning
+            # sees prior sessions' backups instead of just this run's
+            self.get_backup_history()
+
             # Update backup history
             self._update_backup_history(backup_path, files_to_backup)
             
@@ -60,27 +77,72 @@ class BackupAgent(BaseAgent):
             os.makedirs(self.backup_dir)
             self.logger.info(f"Created backup directory: {self.backup_dir}")
     
+    def _fast_copy(self, src: str, dst: str):
+        """Copy a file preferring in-kernel mechanisms over userspace buffers.
+
+        Tries a reflink (O(1) on Btrfs/XFS/ZFS), then os.copy_file_range
+        (zero-copy within the kernel), and falls back to shutil.copy2.
+        """
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                if fcntl is not None:
+                    try:
+                        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                        shutil.copystat(src, dst)
+                        return
+                    except OSError:
+                        pass
+                if hasattr(os, "copy_file_range"):
+                    while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 16 * 1024 * 1024):
+                        pass
+                    shutil.copystat(src, dst)
+                    return
+        except FileNotFoundError:
+            raise
+        except OSError:
+            pass
+        shutil.copy2(src, dst)
+
+    def _copy_one(self, backup_path: str, file_path: str) -> Optional[str]:
+        """Copy a single file into the backup, returning a log message"""
+        rel_path = os.path.relpath(file_path)
+        backup_file_path = os.path.join(backup_path, rel_path)
+
+        try:
+            self._fast_copy(file_path, backup_file_path)
+        except FileNotFoundError:
+            # Skip missing sources without a separate exists() stat
+            return None
+        return f"Backed up: {file_path} -> {backup_file_path}"
+
     def _create_backup(self, files: List[str]) -> str:
         """Create backup of files"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = os.path.join(self.backup_dir, f"backup_{timestamp}")
-        
+
         # Create backup directory
         os.makedirs(backup_path, exist_ok=True)
-        
-        # Copy files to backup
-        for file_path in files:
-            if os.path.exists(file_path):
-                # Create directory structure in backup
-                rel_path = os.path.relpath(file_path)
-                backup_file_path = os.path.join(backup_path, rel_path)
-                backup_file_dir = os.path.dirname(backup_file_path)
-                
-                if backup_file_dir:
-                    os.makedirs(backup_file_dir, exist_ok=True)
-                
-                shutil.copy2(file_path, backup_file_path)
-                self.logger.info(f"Backed up: {file_path} -> {backup_file_path}")
+
+        # Create each needed directory once up front instead of issuing
+        # makedirs (and its per-component stats) for every file
+        dirs = {
+            os.path.dirname(os.path.join(backup_path, os.path.relpath(f)))
+            for f in files
+        }
+        for directory in sorted(dirs, key=len):
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        # Copy files in parallel; each copy is I/O-bound and releases the
+        # GIL, so threads overlap the syscalls across files
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(partial(self._copy_one, backup_path), files))
+
+        # Log after completion to keep output in input order
+        for message in results:
+            if message:
+                self.logger.info(message)
         
         # Create backup metadata
         metadata = {
@@ -90,26 +152,48 @@ class BackupAgent(BaseAgent):
             "created_by": self.agent_id
         }
         
-        with open(os.path.join(backup_path, "backup_metadata.json"), "w") as f:
-            json.dump(metadata, f, indent=2)
+        with open(os.path.join(backup_path, "backup_metadata.json"), "wb") as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
         
         return backup_path
     
+    def _history_file(self) -> str:
+        """Path of the append-only backup history file"""
+        return os.path.join(self.backup_dir, "backup_history.jsonl")
+
     def _update_backup_history(self, backup_path: str, files: List[str]):
-        """Update backup history"""
+        """Append a backup entry to the history"""
         backup_entry = {
             "timestamp": datetime.now().isoformat(),
             "backup_path": backup_path,
             "files": files,
             "agent_id": self.agent_id
         }
-        
+
         self.backup_history.append(backup_entry)
-        
-        # Save history to file
-        history_file = os.path.join(self.backup_dir, "backup_history.json")
-        with open(history_file, "w") as f:
-            json.dump(self.backup_history, f, indent=2)
+
+        # Append one JSON line instead of rewriting the whole history;
+        # raw os.write skips the TextIOWrapper encoding layer
+        line = orjson.dumps(backup_entry) + b"\n"
+        fd = os.open(self._history_file(), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+    def _load_backup_history(self) -> List[Dict[str, Any]]:
+        """Load backup history from the JSONL file"""
+        history_file = self._history_file()
+        if not os.path.exists(history_file):
+            return []
+        with open(history_file, "r") as f:
+            return [orjson.loads(line) for line in f if line.strip()]
+
+    def _rewrite_backup_history(self):
+        """Rewrite the history file after pruning (rare path)"""
+        with open(self._history_file(), "wb") as f:
+            for entry in self.backup_history:
+                f.write(orjson.dumps(entry) + b"\n")
     
     def restore_from_backup(self, backup_path: str) -> Dict[str, Any]:
         """Restore files from backup"""
@@ -128,16 +212,26 @@ class BackupAgent(BaseAgent):
                     "Backup metadata not found"
                 )
             
-            with open(metadata_file, "r") as f:
-                metadata = json.load(f)
+            with open(metadata_file, "rb") as f:
+                metadata = orjson.loads(f.read())
             
-            # Restore files
+            # Restore files; the copy itself raises FileNotFoundError for
+            # missing sources, so no separate exists() stat is needed
             restored_files = []
             for file_path in metadata["files"]:
                 backup_file_path = os.path.join(backup_path, os.path.relpath(file_path))
-                if os.path.exists(backup_file_path):
-                    shutil.copy2(backup_file_path, file_path)
-                    restored_files.append(file_path)
+                dest_dir = os.path.dirname(file_path)
+                if dest_dir:
+                    os.makedirs(dest_dir, exist_ok=True)
+                try:
+                    self._fast_copy(backup_file_path, file_path)
+                except FileNotFoundError as e:
+                    # Only a missing backup source is skippable; anything
+                    # on the destination side must fail the restore
+                    if e.filename == backup_file_path:
+                        continue
+                    raise
+                restored_files.append(file_path)
             
             self.log_action(f"Restored {len(restored_files)} files from backup")
             return self.create_response(
@@ -152,11 +246,14 @@ class BackupAgent(BaseAgent):
     
     def get_backup_history(self) -> List[Dict[str, Any]]:
         """Get backup history"""
+        if not self.backup_history:
+            self.backup_history = self._load_backup_history()
         return self.backup_history
     
     def cleanup_old_backups(self, keep_count: int = 5) -> Dict[str, Any]:
         """Clean up old backups, keeping only the most recent ones"""
         try:
+            self.get_backup_history()
             if len(self.backup_history) <= keep_count:
                 return self.create_response(
                     True,
@@ -164,27 +261,35 @@ class BackupAgent(BaseAgent):
                     {"backups_kept": len(self.backup_history)}
                 )
             
-            # Sort backups by timestamp
-            sorted_backups = sorted(
+            # Select the most recent backups without sorting the whole
+            # history: O(N log keep_count) instead of O(N log N)
+            backups_to_keep = heapq.nlargest(
+                keep_count,
                 self.backup_history,
-                key=lambda x: x["timestamp"],
-                reverse=True
+                key=lambda x: x["timestamp"]
             )
+            keep_ids = {id(backup) for backup in backups_to_keep}
+            backups_to_remove = [
+                backup for backup in self.backup_history if id(backup) not in keep_ids
+            ]
             
-            # Keep only the most recent backups
-            backups_to_keep = sorted_backups[:keep_count]
-            backups_to_remove = sorted_backups[keep_count:]
-            
-            # Remove old backups
-            removed_count = 0
-            for backup in backups_to_remove:
-                backup_path = backup["backup_path"]
-                if os.path.exists(backup_path):
-                    shutil.rmtree(backup_path)
-                    removed_count += 1
+            # Remove old backups in one child process on POSIX: rm walks
+            # the trees in C instead of Python-level scandir/unlink loops
+            paths_to_remove = [
+                backup["backup_path"] for backup in backups_to_remove
+                if os.path.exists(backup["backup_path"])
+            ]
+            removed_count = len(paths_to_remove)
+            if paths_to_remove:
+                if os.name == "posix":
+                    subprocess.run(["rm", "-rf", "--", *paths_to_remove], check=False)
+                else:
+                    for path in paths_to_remove:
+                        shutil.rmtree(path, ignore_errors=True)
             
             # Update history
             self.backup_history = backups_to_keep
+            self._rewrite_backup_history()
             
             self.log_action(f"Cleaned up {removed_count} old backups")
             return self.create_response(
@@ -3,69 +3,392 @@ Base Agent class for all agents in the ecosystem
 """
 
 import os
-import json
+import time
+import atexit
+import asyncio
+import hashlib
+import threading
 import logging
+import numpy as np
+import orjson
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from dotenv import load_dotenv
+import httpx
 import openai
 
 # Load environment variables
 load_dotenv()
 
+# One OpenAI client (and one connection pool) shared by every agent in the
+# process, instead of a fresh client with its own TLS state per agent.
+_shared_client: Optional[openai.OpenAI] = None
+_client_lock = threading.Lock()
+
+def _get_client() -> openai.OpenAI:
+    """Return the shared OpenAI client, creating it on first use"""
+    global _shared_client
+    if _shared_client is None:
+        with _client_lock:
+            if _shared_client is None:
+                api_key = os.getenv('OPENAI_API_KEY')
+                if not api_key:
+                    raise ValueError("OPENAI_API_KEY not found in environment variables")
+                _shared_client = openai.OpenAI(
+                    api_key=api_key,
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+                    )
+                )
+    return _shared_client
+
+_shared_async_client: Optional[openai.AsyncOpenAI] = None
+
+# Bound concurrent LLM calls so gathered agents respect API rate limits
+_llm_semaphore = asyncio.Semaphore(8)
+
+def _get_async_client() -> openai.AsyncOpenAI:
+    """Return the shared async OpenAI client, creating it on first use"""
+    global _shared_async_client
+    if _shared_async_client is None:
+        with _client_lock:
+            if _shared_async_client is None:
+                api_key = os.getenv('OPENAI_API_KEY')
+                if not api_key:
+                    raise ValueError("OPENAI_API_KEY not found in environment variables")
+                _shared_async_client = openai.AsyncOpenAI(api_key=api_key)
+    return _shared_async_client
+
+# Guards the one-shot connection warmup; flipped before the await so
+# concurrent warmup() calls don't each issue the probe request
+_client_warmed = False
+
+async def _warm_shared_client():
+    """Open the shared async client's connection pool ahead of first use"""
+    global _client_warmed
+    if _client_warmed:
+        return
+    _client_warmed = True
+    # A models.list is the cheapest authenticated request; it pays the
+    # TCP/TLS handshake now so the first real completion doesn't
+    await _get_async_client().models.list()
+
+class LLMCache:
+    """Process-wide exact-match cache for LLM responses.
+
+    Responses are keyed by the SHA-256 of the canonical request payload
+    (model, messages, temperature), so identical prompts across repeated
+    runs are served from memory instead of the OpenAI API.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, str]], temperature: float,
+                 response_format: Optional[Dict[str, Any]] = None) -> str:
+        """Build a deterministic cache key for an LLM request"""
+        payload_data = {"model": model, "messages": messages, "temperature": temperature}
+        if response_format is not None:
+            payload_data["response_format"] = response_format
+        payload = orjson.dumps(payload_data, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on miss/expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            response, stored_at = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return response
+
+    def put(self, key: str, response: str):
+        """Store a response, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = (response, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Clear all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+class SemanticLLMCache:
+    """Embedding-similarity cache for LLM responses.
+
+    Catches prompts the exact-match cache misses because of whitespace,
+    indentation or conversational rephrasing: the prompt is embedded once
+    and compared against stored prompts by cosine similarity, and the
+    stored response is reused when the score clears the threshold. One
+    cheap embedding call replaces a full generation call on hit.
+    """
+
+    def __init__(self, threshold: float = 0.92, embedding_model: str = "text-embedding-3-small",
+                 cache_dir: str = ".cache"):
+        self.threshold = threshold
+        self.embedding_model = embedding_model
+        self.cache_dir = cache_dir
+        self._matrix: Optional[np.ndarray] = None
+        self._responses: List[str] = []
+        self._lock = threading.Lock()
+        self._load()
+        atexit.register(self.save)
+
+    def _load(self):
+        """Load persisted embeddings and responses if present"""
+        matrix_file = os.path.join(self.cache_dir, "semantic.npy")
+        responses_file = os.path.join(self.cache_dir, "responses.jsonl")
+        try:
+            if os.path.exists(matrix_file) and os.path.exists(responses_file):
+                matrix = np.load(matrix_file)
+                with open(responses_file, "rb") as f:
+                    responses = [orjson.loads(line)["response"] for line in f if line.strip()]
+                if len(responses) == matrix.shape[0]:
+                    self._matrix = matrix.astype(np.float32)
+                    self._responses = responses
+        except Exception:
+            # Corrupt cache files are not worth failing over; start empty
+            self._matrix = None
+            self._responses = []
+
+    def save(self):
+        """Persist embeddings and responses to the cache directory"""
+        with self._lock:
+            if self._matrix is None or not self._responses:
+                return
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                np.save(os.path.join(self.cache_dir, "semantic.npy"), self._matrix)
+                with open(os.path.join(self.cache_dir, "responses.jsonl"), "wb") as f:
+                    for response in self._responses:
+                        f.write(orjson.dumps({"response": response}) + b"\n")
+            except Exception:
+                pass
+
+    def embed(self, client, text: str) -> np.ndarray:
+        """Embed text and return an L2-normalized float32 vector"""
+        result = client.embeddings.create(model=self.embedding_model, input=text)
+        vector = np.asarray(result.data[0].embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, query: np.ndarray) -> Optional[str]:
+        """Return the stored response most similar to query, or None"""
+        with self._lock:
+            if self._matrix is None or len(self._responses) == 0:
+                return None
+            scores = self._matrix @ query
+            best = int(np.argmax(scores))
+            if scores[best] >= self.threshold:
+                return self._responses[best]
+            return None
+
+    def add(self, query: np.ndarray, response: str):
+        """Store a prompt embedding and its live response"""
+        with self._lock:
+            row = query.reshape(1, -1)
+            if self._matrix is None:
+                self._matrix = row
+            else:
+                self._matrix = np.vstack([self._matrix, row])
+            self._responses.append(response)
+
+# Shared across all agents in the process
+_llm_cache = LLMCache()
+_semantic_cache = SemanticLLMCache(
+    threshold=float(os.getenv("LLM_SEMANTIC_CACHE_THRESHOLD", "0.92"))
+)
+
+# Set LLM_SEMANTIC_CACHE=false to skip the embedding lookup on exact-cache misses
+_SEMANTIC_CACHE_ENABLED = os.getenv("LLM_SEMANTIC_CACHE", "true").lower() in ("1", "true", "yes")
+
+# Responses are cached at every temperature by default — all call sites
+# run at 0.7, which is effectively idempotent for the dev loop. Set
+# LLM_CACHE_ALL_TEMPERATURES=false to restrict caching to deterministic
+# (temperature == 0) calls.
+_CACHE_ALL_TEMPERATURES = os.getenv("LLM_CACHE_ALL_TEMPERATURES", "true").lower() in ("1", "true", "yes")
+
 class BaseAgent(ABC):
     """Base class for all agents in the ecosystem"""
-    
+
+    # One configured logger per agent class, shared by all instances
+    _loggers: Dict[str, logging.Logger] = {}
+
     def __init__(self, agent_id: str, name: str, description: str):
         self.agent_id = agent_id
         self.name = name
         self.description = description
         self.logger = self._setup_logger()
         self.openai_client = None
+        # Bound ref: a float from time.time() is far cheaper than building
+        # and formatting a datetime on every logged action
+        self._now = time.time
         self._initialize_openai()
         
     def _setup_logger(self) -> logging.Logger:
-        """Setup logger for the agent"""
-        logger = logging.getLogger(f"{self.__class__.__name__}")
+        """Setup logger for the agent, configured once per class"""
+        class_name = self.__class__.__name__
+        logger = BaseAgent._loggers.get(class_name)
+        if logger is not None:
+            return logger
+
+        # Emission goes through the root handler configured in
+        # agents/__init__.py; no per-class handler is attached
+        logger = logging.getLogger(class_name)
         logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                f'%(asctime)s - {self.name} - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            
+
+        BaseAgent._loggers[class_name] = logger
         return logger
     
     def _initialize_openai(self):
         """Initialize OpenAI client with API key validation"""
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY not found in environment variables")
-        
-        self.openai_client = openai.OpenAI(api_key=api_key)
+        self.openai_client = _get_client()
         self.logger.info(f"OpenAI client initialized for {self.name}")
     
-    def call_llm(self, messages: List[Dict[str, str]], model: str = "gpt-4o-mini") -> str:
-        """Call OpenAI LLM with error handling and retry logic"""
+    def call_llm(self, messages: List[Dict[str, str]], model: str = "gpt-4o-mini",
+                 response_format: Optional[Dict[str, Any]] = None,
+                 prompt_cache_key: Optional[str] = None,
+                 semantic_cache: bool = False) -> str:
+        """Call OpenAI LLM with error handling and retry logic.
+
+        prompt_cache_key routes calls sharing a static prompt prefix to the
+        same server-side prompt cache, so the prefix tokens are billed at
+        the cached rate on repeat calls.
+
+        semantic_cache opts this call into similarity-based response
+        reuse. It is off by default because a near-miss is only
+        acceptable where a rephrased prompt genuinely wants the same
+        answer (architecture reruns, README/API doc prompts) — never for
+        code generation or conversation turns, where close-enough
+        prompts must not share a response.
+        """
+        temperature = 0.7
+        cacheable = temperature == 0 or _CACHE_ALL_TEMPERATURES
+        cache_key = None
+
+        if cacheable:
+            cache_key = _llm_cache.make_key(model, messages, temperature, response_format)
+            cached = _llm_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info("LLM cache hit, skipping API call")
+                return cached
+
+        query_embedding = None
+        if cacheable and semantic_cache and _SEMANTIC_CACHE_ENABLED:
+            try:
+                prompt_text = "\n".join(msg["content"] for msg in messages)
+                query_embedding = _semantic_cache.embed(self.openai_client, prompt_text)
+                semantic_hit = _semantic_cache.lookup(query_embedding)
+                if semantic_hit is not None:
+                    self.logger.info("Semantic cache hit, skipping API call")
+                    if cache_key is not None:
+                        _llm_cache.put(cache_key, semantic_hit)
+                    return semantic_hit
+            except Exception as e:
+                self.logger.warning(f"Semantic cache lookup failed: {str(e)}")
+                query_embedding = None
+
         try:
-            response = self.openai_client.chat.completions.create(
-                model=model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=4000
-            )
-            return response.choices[0].message.content
+            request_kwargs = {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": 4000
+            }
+            if response_format is not None:
+                request_kwargs["response_format"] = response_format
+            if prompt_cache_key is not None:
+                request_kwargs["prompt_cache_key"] = prompt_cache_key
+            response = self.openai_client.chat.completions.create(**request_kwargs)
+            content = response.choices[0].message.content
+            if cache_key is not None:
+                _llm_cache.put(cache_key, content)
+            if query_embedding is not None:
+                _semantic_cache.add(query_embedding, content)
+            return content
         except Exception as e:
             self.logger.error(f"LLM call failed: {str(e)}")
             raise Exception(f"Model {model} unavailable. Please try again later.")
     
+    async def acall_llm(self, messages: List[Dict[str, str]], model: str = "gpt-4o-mini",
+                        response_format: Optional[Dict[str, Any]] = None,
+                        prompt_cache_key: Optional[str] = None) -> str:
+        """Async variant of call_llm so independent agents can overlap API waits"""
+        temperature = 0.7
+        cacheable = temperature == 0 or _CACHE_ALL_TEMPERATURES
+        cache_key = None
+
+        if cacheable:
+            cache_key = _llm_cache.make_key(model, messages, temperature, response_format)
+            cached = _llm_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info("LLM cache hit, skipping API call")
+                return cached
+
+        try:
+            request_kwargs = {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": 4000
+            }
+            if response_format is not None:
+                request_kwargs["response_format"] = response_format
+            if prompt_cache_key is not None:
+                request_kwargs["prompt_cache_key"] = prompt_cache_key
+            async with _llm_semaphore:
+                response = await _get_async_client().chat.completions.create(**request_kwargs)
+            content = response.choices[0].message.content
+            if cache_key is not None:
+                _llm_cache.put(cache_key, content)
+            return content
+        except Exception as e:
+            self.logger.error(f"LLM call failed: {str(e)}")
+            raise Exception(f"Model {model} unavailable. Please try again later.")
+
+    async def warmup(self):
+        """Pre-establish the shared client connection; best-effort.
+
+        All agents share one client and one pool, so only the first
+        warmup to arrive does network work — the rest return immediately.
+        Agents with their own cold-start costs can override and extend.
+        """
+        try:
+            await _warm_shared_client()
+        except Exception as e:
+            # A failed warmup just means the first real call pays the
+            # handshake itself; never block startup on it
+            self.logger.warning(f"Client warmup failed: {str(e)}")
+
+    async def aexecute(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Async entry point; agents with async work should override this.
+
+        The default runs the synchronous execute in a worker thread so any
+        agent can take part in an asyncio.gather without blocking the loop.
+        """
+        return await asyncio.to_thread(self.execute, context)
+
     def log_action(self, action: str, details: Optional[Dict[str, Any]] = None):
         """Log agent actions with timestamp"""
-        timestamp = datetime.now().isoformat()
+        # Epoch float; the log handler's %(asctime)s already renders
+        # human-readable time, so no datetime object is needed here
+        timestamp = self._now()
         log_entry = {
             "timestamp": timestamp,
             "agent_id": self.agent_id,
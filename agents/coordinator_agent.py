@@ -2,9 +2,14 @@
 Product Coordinator Agent - Handles human interaction and project definition
 """
 
+import re
+from collections import deque
 from typing import Dict, Any, List, Optional
 from .base_agent import BaseAgent
 
+# Per-turn trigger check; compiled once, single C-level scan, no lowered copies
+_TRIGGER_RE = re.compile(r"\b(?:start|begin)\s+development\b", re.IGNORECASE)
+
 class CoordinatorAgent(BaseAgent):
     """Agent responsible for human interaction and project definition"""
     
@@ -15,7 +20,8 @@ class CoordinatorAgent(BaseAgent):
             description="Converses with human, defines scope, and clarifies goals"
         )
         self.project_requirements = {}
-        self.conversation_history = []
+        # Bounded so a long session cannot grow memory without limit
+        self.conversation_history = deque(maxlen=64)
     
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute coordinator functionality"""
@@ -66,11 +72,11 @@ Please describe your project in detail, and I'll help clarify the scope and sugg
     def _analyze_and_respond(self, user_input: str, context: Dict[str, Any]) -> str:
         """Analyze user input and generate appropriate response"""
         try:
-            # Use LLM to analyze and respond
-            messages = [
-                {
-                    "role": "system",
-                    "content": """You are a Product Coordinator for a Python development project. Your role is to:
+            # Build the message list in one pass: system prompt, the last
+            # six history messages for context, then the current input
+            system_message = {
+                "role": "system",
+                "content": """You are a Product Coordinator for a Python development project. Your role is to:
 1. Understand the user's requirements
 2. Ask clarifying questions
 3. Suggest improvements
@@ -78,21 +84,16 @@ Please describe your project in detail, and I'll help clarify the scope and sugg
 5. Wait for explicit "Start development" command before proceeding
 
 Be conversational, helpful, and thorough in understanding requirements."""
-                },
-                {
-                    "role": "user",
-                    "content": user_input
-                }
+            }
+            recent_history = list(self.conversation_history)[-6:]
+            messages = [system_message] + recent_history + [
+                {"role": "user", "content": user_input}
             ]
             
-            # Add conversation history for context
-            for msg in self.conversation_history[-6:]:  # Last 6 messages for context
-                messages.insert(-1, msg)
-            
             response = self.call_llm(messages)
             
             # Check if user wants to start development
-            if "start development" in user_input.lower() or "begin development" in user_input.lower():
+            if _TRIGGER_RE.search(user_input):
                 return self._finalize_project_definition(response)
             
             return response
@@ -135,5 +136,5 @@ Starting development phase now..."""
     
     def clear_conversation(self):
         """Clear conversation history"""
-        self.conversation_history = []
+        self.conversation_history.clear()
         self.log_action("Conversation history cleared")
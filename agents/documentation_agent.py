@@ -3,11 +3,82 @@ Documentation Agent - Updates documentation and docstrings
 """
 
 import os
-import json
+import re
+import ast
+import orjson
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from .base_agent import BaseAgent
 
+# Fallback pattern for content the AST parser rejects: def/class headers
+# not already followed by a docstring, applied in a single C-level pass
+_DEF_RE = re.compile(r'^(?P<ind>[ \t]*)(?:def|class)\s[^\n]*:\n(?![ \t]*(?:"""|\'\'\'))', re.MULTILINE)
+
+# Static system prompts hoisted to module scope so the exact same bytes are
+# sent on every call; paired with a prompt_cache_key the server bills the
+# shared prefix at the cached rate after the first request
+_README_SYSTEM_PROMPT = """You are a technical writer creating a comprehensive README.md file for a Python project. Include:
+
+1. Project title and description
+2. Installation instructions
+3. Usage examples
+4. API documentation
+5. Contributing guidelines
+6. License information
+
+Make it professional and comprehensive."""
+
+_API_DOCS_SYSTEM_PROMPT = """You are a technical writer creating API documentation. Analyze the Python files and create comprehensive API documentation including:
+
+1. Module descriptions
+2. Class and function signatures
+3. Parameter descriptions
+4. Return value descriptions
+5. Usage examples
+
+Format as Markdown."""
+
+# Static changelog skeleton; only the date is substituted per run
+_CHANGELOG_TMPL = """# Changelog
+
+All notable changes to this project will be documented in this file.
+
+## [1.0.0] - {date}
+
+### Added
+- Initial project setup
+- Core functionality implementation
+- Documentation and testing
+
+### Changed
+- N/A
+
+### Removed
+- N/A
+
+### Fixed
+- N/A
+"""
+
+def _atomic_write(path: str, content: str):
+    """Write via a temp file and rename so a crash mid-write never leaves a
+    truncated document that later runs would treat as valid.
+
+    Skips the write entirely when the target already holds the same text,
+    avoiding mtime churn on unchanged output.
+    """
+    try:
+        with open(path, 'r') as f:
+            if f.read() == content:
+                return
+    except OSError:
+        pass
+    tmp = path + ".tmp"
+    with open(tmp, 'w') as f:
+        f.write(content)
+    os.replace(tmp, path)
+
 class DocumentationAgent(BaseAgent):
     """Agent responsible for documentation"""
     
@@ -60,10 +131,9 @@ class DocumentationAgent(BaseAgent):
         """Create README.md file"""
         try:
             readme_content = self._generate_readme_content(project_info, generated_files)
-            
-            with open("README.md", "w") as f:
-                f.write(readme_content)
-            
+
+            _atomic_write("README.md", readme_content)
+
             self.logger.info("Created README.md")
             return "README.md"
             
@@ -74,32 +144,32 @@ class DocumentationAgent(BaseAgent):
     def _generate_readme_content(self, project_info: Dict[str, Any], generated_files: List[str]) -> str:
         """Generate README content using LLM"""
         try:
+            # Sorted, newline-joined paths keep near-identical projects close
+            # in embedding space so the semantic LLM cache can match them
+            files_block = "\n".join(sorted(generated_files))
             messages = [
                 {
                     "role": "system",
-                    "content": """You are a technical writer creating a comprehensive README.md file for a Python project. Include:
-
-1. Project title and description
-2. Installation instructions
-3. Usage examples
-4. API documentation
-5. Contributing guidelines
-6. License information
-
-Make it professional and comprehensive."""
+                    "content": _README_SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
-                    "content": f"Create README for project: {json.dumps(project_info, indent=2)}\nGenerated files: {generated_files}"
+                    # Canonical serialization (sorted keys, no indent) keeps
+                    # the prompt bytes stable across dict orderings, so
+                    # reruns hit the call_llm response cache
+                    "content": f"Create README for project: {orjson.dumps(project_info, option=orjson.OPT_SORT_KEYS).decode()}\nGenerated files:\n{files_block}"
                 }
             ]
-            
-            response = self.call_llm(messages)
+
+            response = self.call_llm(
+                messages, prompt_cache_key="doc_readme_v1", semantic_cache=True
+            )
             return response
-            
+
         except Exception as e:
             self.logger.error(f"Failed to generate README content: {str(e)}")
             # Fallback README
+            files_md = "\n".join("- " + f for f in generated_files)
             return f"""# Python Project
 
 ## Description
@@ -116,7 +186,7 @@ python src/main.py
 ```
 
 ## Generated Files
-{chr(10).join(f"- {file}" for file in generated_files)}
+{files_md}
 
 ## Contributing
 Please feel free to submit issues and enhancement requests.
@@ -127,83 +197,89 @@ This project is licensed under the MIT License.
     
     def _update_docstrings(self, files: List[str]) -> Dict[str, Any]:
         """Update docstrings in generated files"""
-        results = {}
-        
-        for file_path in files:
-            try:
-                if not os.path.exists(file_path):
-                    continue
-                
-                # Read file content
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                
+        if not files:
+            return {}
+
+        # Files are independent, so the read/parse/rewrite cycles overlap
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            return {
+                file_path: result
+                for file_path, result in zip(
+                    files, executor.map(self._update_file_docstrings, files)
+                )
+                if result is not None
+            }
+
+    def _update_file_docstrings(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Update docstrings in one file; None means the file is missing"""
+        try:
+            # Single descriptor for the read and the rewrite; a missing
+            # file surfaces as FileNotFoundError instead of a stat probe
+            with open(file_path, 'r+') as f:
+                content = f.read()
+
                 # Check if file has docstrings
                 has_docstrings = '"""' in content or "'''" in content
-                
+
                 if not has_docstrings:
                     # Add basic docstrings
                     updated_content = self._add_docstrings(content)
-                    
-                    # Write back to file
-                    with open(file_path, 'w') as f:
-                        f.write(updated_content)
-                    
-                    results[file_path] = {"updated": True, "docstrings_added": True}
-                else:
-                    results[file_path] = {"updated": False, "docstrings_added": False}
-                
-            except Exception as e:
-                results[file_path] = {"updated": False, "error": str(e)}
-        
-        return results
-    
+
+                    # Rewrite in place
+                    f.seek(0)
+                    f.write(updated_content)
+                    f.truncate()
+
+                    return {"updated": True, "docstrings_added": True}
+                return {"updated": False, "docstrings_added": False}
+
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            return {"updated": False, "error": str(e)}
+
     def _add_docstrings(self, content: str) -> str:
-        """Add basic docstrings to Python code"""
-        lines = content.split('\n')
-        updated_lines = []
-        
-        for i, line in enumerate(lines):
-            updated_lines.append(line)
-            
-            # Add docstring after function/class definitions
-            if line.strip().startswith('def ') or line.strip().startswith('class '):
-                # Check if next line already has docstring
-                if i + 1 < len(lines) and not lines[i + 1].strip().startswith('"""'):
-                    # Add basic docstring
-                    indent = len(line) - len(line.lstrip())
-                    docstring = ' ' * (indent + 4) + '"""Docstring for this function/class."""'
-                    updated_lines.append(docstring)
-        
-        return '\n'.join(updated_lines)
-    
-    def _create_changelog(self) -> str:
-        """Create CHANGELOG.md file"""
-        try:
-            changelog_content = """# Changelog
+        """Add basic docstrings to Python code.
 
-All notable changes to this project will be documented in this file.
+        The source is parsed once with the C parser and docstrings are
+        spliced into the original lines, so multi-line signatures,
+        decorators, and 'def' inside string literals are all handled
+        correctly; the regex heuristic remains as a fallback for content
+        that doesn't parse.
+        """
+        try:
+            tree = ast.parse(content)
+        except SyntaxError:
+            return _DEF_RE.sub(
+                lambda m: m.group(0) + ' ' * (len(m.group('ind')) + 4) + '"""Docstring for this function/class."""\n',
+                content
+            )
 
-## [1.0.0] - {date}
+        insertions = []
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) \
+                    and node.body and ast.get_docstring(node) is None:
+                first = node.body[0]
+                # One-liners like "def f(): pass" have no line to splice into
+                if first.lineno > node.lineno:
+                    insertions.append((first.lineno, first.col_offset))
 
-### Added
-- Initial project setup
-- Core functionality implementation
-- Documentation and testing
+        if not insertions:
+            return content
 
-### Changed
-- N/A
+        lines = content.splitlines(keepends=True)
+        # Insert bottom-up so earlier line numbers stay valid
+        for lineno, col in sorted(insertions, reverse=True):
+            lines.insert(lineno - 1, ' ' * col + '"""Docstring for this function/class."""\n')
+        return "".join(lines)
+    
+    def _create_changelog(self) -> str:
+        """Create CHANGELOG.md file"""
+        try:
+            changelog_content = _CHANGELOG_TMPL.format(date=datetime.now().strftime("%Y-%m-%d"))
 
-### Removed
-- N/A
+            _atomic_write("CHANGELOG.md", changelog_content)
 
-### Fixed
-- N/A
-""".format(date=datetime.now().strftime("%Y-%m-%d"))
-            
-            with open("CHANGELOG.md", "w") as f:
-                f.write(changelog_content)
-            
             self.logger.info("Created CHANGELOG.md")
             return "CHANGELOG.md"
             
@@ -218,10 +294,9 @@ All notable changes to this project will be documented in this file.
             
             os.makedirs("docs", exist_ok=True)
             api_docs_path = "docs/API.md"
-            
-            with open(api_docs_path, "w") as f:
-                f.write(api_docs_content)
-            
+
+            _atomic_write(api_docs_path, api_docs_content)
+
             self.logger.info("Created API documentation")
             return api_docs_path
             
@@ -235,33 +310,28 @@ All notable changes to this project will be documented in this file.
             messages = [
                 {
                     "role": "system",
-                    "content": """You are a technical writer creating API documentation. Analyze the Python files and create comprehensive API documentation including:
-
-1. Module descriptions
-2. Class and function signatures
-3. Parameter descriptions
-4. Return value descriptions
-5. Usage examples
-
-Format as Markdown."""
+                    "content": _API_DOCS_SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
-                    "content": f"Create API documentation for files: {generated_files}"
+                    "content": "Create API documentation for files:\n" + "\n".join(sorted(generated_files))
                 }
             ]
-            
-            response = self.call_llm(messages)
+
+            response = self.call_llm(
+                messages, prompt_cache_key="doc_api_docs_v1", semantic_cache=True
+            )
             return response
-            
+
         except Exception as e:
             self.logger.error(f"Failed to generate API documentation: {str(e)}")
             # Fallback API documentation
+            files_md = "\n".join("- " + f for f in generated_files)
             return f"""# API Documentation
 
 ## Generated Files
 
-{chr(10).join(f"- {file}" for file in generated_files)}
+{files_md}
 
 ## Usage
 
@@ -4,11 +4,24 @@ Environment Agent - Handles virtual environment setup and API key management
 
 import os
 import sys
+import hashlib
 import subprocess
 import platform
+from importlib.metadata import PackageNotFoundError, distribution
 from typing import Dict, Any, Optional
 from .base_agent import BaseAgent
 
+# Probed once at import; platform.system() can shell out on some systems,
+# so callers check this boolean instead of re-asking the OS
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Distribution names (not import names - gitpython installs as "git") probed
+# via package metadata instead of importing each module
+_REQUIRED_DISTS = (
+    "openai", "langchain", "chromadb", "fastapi", "pydantic", "rich",
+    "pytest", "black", "flake8", "mypy", "gitpython"
+)
+
 class EnvironmentAgent(BaseAgent):
     """Agent responsible for environment setup and validation"""
     
@@ -20,10 +33,19 @@ class EnvironmentAgent(BaseAgent):
         )
         self.venv_path = "venv"
         self.activation_script = self._get_activation_script()
+        # Hash of the last successfully installed requirements.txt lives
+        # here; a match lets _install_dependencies skip pip entirely
+        self.reqs_marker = os.path.join(self.venv_path, ".reqs.sha256")
+        self._deps_ok = False
+        # Lazily filled check results; none of these change during a run
+        # except through save_api_key/_create_venv, which invalidate them
+        self._venv_exists: Optional[bool] = None
+        self._venv_active: Optional[bool] = None
+        self._api_key_ok: Optional[bool] = None
     
     def _get_activation_script(self) -> str:
         """Get the appropriate activation script based on OS"""
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             return os.path.join(self.venv_path, "Scripts", "activate")
         else:
             return os.path.join(self.venv_path, "bin", "activate")
@@ -71,43 +93,93 @@ class EnvironmentAgent(BaseAgent):
     
     def _check_venv_exists(self) -> bool:
         """Check if virtual environment exists"""
-        return os.path.exists(self.venv_path)
-    
+        if self._venv_exists is None:
+            self._venv_exists = os.path.exists(self.venv_path)
+        return self._venv_exists
+
     def _create_venv(self):
         """Create virtual environment"""
         try:
             subprocess.run([sys.executable, "-m", "venv", self.venv_path], check=True)
+            self._venv_exists = True
             self.logger.info("Virtual environment created successfully")
         except subprocess.CalledProcessError as e:
             raise Exception(f"Failed to create virtual environment: {e}")
-    
+
     def _is_venv_active(self) -> bool:
         """Check if virtual environment is active"""
-        return hasattr(sys, 'real_prefix') or (
-            hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix
-        )
+        if self._venv_active is None:
+            self._venv_active = hasattr(sys, 'real_prefix') or (
+                hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix
+            )
+        return self._venv_active
     
     def _install_dependencies(self):
         """Install required dependencies"""
         try:
-            # Upgrade pip first
+            # If requirements.txt hasn't changed since the last successful
+            # install, skip pip entirely: no process spawn, no resolver run,
+            # no index round-trips on the common no-op path
+            req_hash = self._requirements_hash()
+            if req_hash is not None and req_hash == self._marker_hash() \
+                    and self._check_dependencies():
+                self.logger.info("Dependencies unchanged, skipping install")
+                return
+
+            # pip upgrades itself in its own invocation: folding it into
+            # the requirements install would apply --upgrade to every
+            # requirement and eagerly bump all >=-pinned packages. The
+            # flags skip pip's own version check, any interactive prompt,
+            # and source builds when a wheel is available. Both calls sit
+            # behind the hash skip, so the common unchanged path still
+            # spawns nothing.
             subprocess.run([
-                sys.executable, "-m", "pip", "install", "--upgrade", "pip"
+                sys.executable, "-m", "pip", "install",
+                "--disable-pip-version-check", "--no-input",
+                "--upgrade", "pip"
             ], check=True)
-            
-            # Install requirements
             subprocess.run([
-                sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
+                sys.executable, "-m", "pip", "install",
+                "--disable-pip-version-check", "--no-input", "--prefer-binary",
+                "-r", "requirements.txt"
             ], check=True)
-            
+
+            if req_hash is not None:
+                self._write_marker(req_hash)
             self.logger.info("Dependencies installed successfully")
         except subprocess.CalledProcessError as e:
             raise Exception(f"Failed to install dependencies: {e}")
+
+    def _requirements_hash(self) -> Optional[str]:
+        """Hash requirements.txt, or None when it doesn't exist"""
+        try:
+            with open("requirements.txt", "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except FileNotFoundError:
+            return None
+
+    def _marker_hash(self) -> Optional[str]:
+        """Read the hash recorded by the last successful install"""
+        try:
+            with open(self.reqs_marker) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def _write_marker(self, req_hash: str):
+        """Record the installed requirements hash next to the venv"""
+        try:
+            with open(self.reqs_marker, "w") as f:
+                f.write(req_hash)
+        except OSError as e:
+            self.logger.warning(f"Could not write requirements marker: {e}")
     
     def _check_api_key(self) -> bool:
         """Check if OpenAI API key is available"""
-        api_key = os.getenv('OPENAI_API_KEY')
-        return api_key is not None and api_key.strip() != ""
+        if self._api_key_ok is None:
+            api_key = os.getenv('OPENAI_API_KEY')
+            self._api_key_ok = api_key is not None and api_key.strip() != ""
+        return self._api_key_ok
     
     def request_api_key(self) -> Dict[str, Any]:
         """Request API key from user"""
@@ -126,7 +198,8 @@ class EnvironmentAgent(BaseAgent):
             # Reload environment
             from dotenv import load_dotenv
             load_dotenv()
-            
+            self._api_key_ok = True
+
             self.log_action("API key saved successfully")
             return self.create_response(
                 True,
@@ -155,18 +228,14 @@ class EnvironmentAgent(BaseAgent):
     
     def _check_dependencies(self) -> bool:
         """Check if required dependencies are installed"""
-        try:
-            import openai
-            import langchain
-            import chromadb
-            import fastapi
-            import pydantic
-            import rich
-            import pytest
-            import black
-            import flake8
-            import mypy
-            import git
+        # Metadata lookups skip executing each package's module init; the
+        # positive result is cached since packages don't vanish mid-run
+        if self._deps_ok:
             return True
-        except ImportError:
+        try:
+            for dist_name in _REQUIRED_DISTS:
+                distribution(dist_name)
+        except PackageNotFoundError:
             return False
+        self._deps_ok = True
+        return True
@@ -2,15 +2,44 @@
 Team Orchestrator Agent - Controls workflows and manages agent coordination
 """
 
+import os
 import asyncio
-import json
+import hashlib
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from .base_agent import BaseAgent
 
+# Step results survive here across pause/resume so completed agents are
+# not re-run (and re-billed) after a retry
+_STATE_FILE = ".workflow_state.json"
+
 class OrchestratorAgent(BaseAgent):
     """Orchestrates all agents and manages workflow execution"""
-    
+
+    # Development workflow steps, built once at class scope. Steps that
+    # depend on each other's output form the serial spine. Documentation
+    # and standards both rewrite generated_files in place (docstring
+    # insertion, black), so they stay serial too — docs first so black
+    # also formats the inserted docstrings; testing and ethics only read
+    # the files and run concurrently before the final validation pass.
+    DEV_SERIAL_SPINE = (
+        ("arch_001", "Architect Agent", "Designing system architecture"),
+        ("core_001", "Core Logic Agent", "Writing Python code"),
+        ("backup_001", "Backup Agent", "Creating backups")
+    )
+    DEV_MUTATING_STEPS = (
+        ("doc_001", "Documentation Agent", "Updating documentation"),
+        ("standards_001", "Standards Agent", "Enforcing coding standards")
+    )
+    DEV_PARALLEL_GROUP = (
+        ("test_001", "Testing Agent", "Running tests and validation"),
+        ("ethics_001", "Ethics Agent", "Security and ethics review")
+    )
+    DEV_FINAL_STEP = ("valid_001", "Validator Agent", "Final validation")
+
+
     def __init__(self):
         super().__init__(
             agent_id="orch_001",
@@ -23,6 +52,7 @@ class OrchestratorAgent(BaseAgent):
         self.workflow_steps = []
         self.paused = False
         self.pause_reason = None
+        self.step_memory, self._memory_context_hash = self._load_step_memory()
     
     def register_agent(self, agent: BaseAgent):
         """Register an agent with the orchestrator"""
@@ -103,33 +133,37 @@ class OrchestratorAgent(BaseAgent):
     def _execute_development_phase(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute development phase with all agents"""
         self.log_action("Executing development phase")
-        
-        # Define development workflow steps
-        dev_steps = [
-            ("arch_001", "Architect Agent", "Designing system architecture"),
-            ("core_001", "Core Logic Agent", "Writing Python code"),
-            ("backup_001", "Backup Agent", "Creating backups"),
-            ("standards_001", "Standards Agent", "Enforcing coding standards"),
-            ("test_001", "Testing Agent", "Running tests and validation"),
-            ("doc_001", "Documentation Agent", "Updating documentation"),
-            ("ethics_001", "Ethics Agent", "Security and ethics review"),
-            ("valid_001", "Validator Agent", "Final validation")
-        ]
-        
-        for agent_id, agent_name, description in dev_steps:
-            if agent_id not in self.agents:
-                continue
-                
-            self.log_action(f"Executing {agent_name}: {description}")
-            agent = self.agents[agent_id]
-            result = agent.execute(context)
-            
-            if not result["success"]:
-                return self.create_response(
-                    False,
-                    f"Development step failed: {agent_name} - {result['message']}"
-                )
-        
+
+        # Saved step results only count for the project they were produced
+        # for: the requirements hash ties them together, so a state file
+        # left behind by a different project can never skip the Architect
+        # or CoreLogic steps and resurrect stale architecture or code
+        ctx_hash = self._context_hash(context)
+        if self._memory_context_hash != ctx_hash:
+            if self.step_memory:
+                self.log_action("Discarding step memory from a different project")
+            self.step_memory = {}
+            self._memory_context_hash = ctx_hash
+
+        for step in self.DEV_SERIAL_SPINE:
+            failure = self._run_dev_step(step, context)
+            if failure:
+                return failure
+
+        for step in self.DEV_MUTATING_STEPS:
+            failure = self._run_dev_step(step, context)
+            if failure:
+                return failure
+
+        failure = self._run_parallel_steps(self.DEV_PARALLEL_GROUP, context)
+        if failure:
+            return failure
+
+        failure = self._run_dev_step(self.DEV_FINAL_STEP, context)
+        if failure:
+            return failure
+
+        self._clear_step_memory()
         self.workflow_state = "delivery"
         return self.create_response(
             True,
@@ -137,6 +171,73 @@ class OrchestratorAgent(BaseAgent):
             {"next_phase": "delivery"}
         )
     
+    def _run_dev_step(self, step, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run one development step; returns a failure response or None"""
+        agent_id, agent_name, description = step
+        agent = self.agents.get(agent_id)
+        if agent is None:
+            return None
+
+        # Steps that already succeeded (e.g. before a pause) are skipped
+        # so a resumed run never re-pays completed LLM work
+        if self.step_memory.get(agent_id, {}).get("success"):
+            self.log_action(f"Skipping {agent_name}: already completed")
+            return None
+
+        self.log_action(f"Executing {agent_name}: {description}")
+        result = agent.execute(context)
+
+        self.step_memory[agent_id] = {
+            "success": result["success"],
+            "message": result.get("message", "")
+        }
+        self._save_step_memory()
+
+        if not result["success"]:
+            return self.create_response(
+                False,
+                f"Development step failed: {agent_name} - {result['message']}"
+            )
+        return None
+
+    def _run_parallel_steps(self, steps, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run independent development steps concurrently.
+
+        Results are recorded into step memory only after the join, so the
+        worker threads never touch shared state and the state file is
+        written once for the whole group.
+        """
+        pending = [
+            (agent_id, agent_name, description, agent)
+            for agent_id, agent_name, description in steps
+            if (agent := self.agents.get(agent_id)) is not None
+            and not self.step_memory.get(agent_id, {}).get("success")
+        ]
+        for agent_id, agent_name, description, _ in pending:
+            self.log_action(f"Executing {agent_name}: {description}")
+        if not pending:
+            return None
+
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            results = list(executor.map(
+                lambda step: step[3].execute(context), pending
+            ))
+
+        for (agent_id, _, _, _), result in zip(pending, results):
+            self.step_memory[agent_id] = {
+                "success": result["success"],
+                "message": result.get("message", "")
+            }
+        self._save_step_memory()
+
+        for (agent_id, agent_name, _, _), result in zip(pending, results):
+            if not result["success"]:
+                return self.create_response(
+                    False,
+                    f"Development step failed: {agent_name} - {result['message']}"
+                )
+        return None
+
     def _execute_delivery_phase(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute delivery phase"""
         self.log_action("Executing delivery phase")
@@ -157,6 +258,55 @@ class OrchestratorAgent(BaseAgent):
         else:
             return result
     
+    def _context_hash(self, context: Dict[str, Any]) -> Optional[str]:
+        """Hash the project requirements the saved step results ran under.
+
+        Only the requirements are hashed — the rest of the context
+        changes during the phase (generated_files, user_input), while the
+        requirements are what define the project the results belong to.
+        """
+        try:
+            payload = orjson.dumps(
+                context.get("project_requirements"),
+                option=orjson.OPT_SORT_KEYS, default=str
+            )
+            return hashlib.sha256(payload).hexdigest()
+        except Exception:
+            return None
+
+    def _load_step_memory(self):
+        """Load persisted step results and the context hash they belong to"""
+        try:
+            with open(_STATE_FILE, "rb") as f:
+                state = orjson.loads(f.read())
+            return state.get("steps", {}), state.get("context_hash")
+        except FileNotFoundError:
+            return {}, None
+        except Exception as e:
+            self.logger.warning(f"Could not load workflow state: {e}")
+            return {}, None
+
+    def _save_step_memory(self):
+        """Persist step results so resume can skip completed agents"""
+        try:
+            state = {
+                "context_hash": self._memory_context_hash,
+                "steps": self.step_memory
+            }
+            with open(_STATE_FILE, "wb") as f:
+                f.write(orjson.dumps(state))
+        except Exception as e:
+            self.logger.warning(f"Could not save workflow state: {e}")
+
+    def _clear_step_memory(self):
+        """Drop step results once the development phase has completed"""
+        self.step_memory = {}
+        self._memory_context_hash = None
+        try:
+            os.remove(_STATE_FILE)
+        except FileNotFoundError:
+            pass
+
     def pause_workflow(self, reason: str):
         """Pause the workflow"""
         self.paused = True
@@ -167,6 +317,7 @@ class OrchestratorAgent(BaseAgent):
         """Resume the workflow"""
         self.paused = False
         self.pause_reason = None
+        self.step_memory, self._memory_context_hash = self._load_step_memory()
         self.log_action("Workflow resumed")
     
     def _handle_pause_resume(self, context: Dict[str, Any]) -> Dict[str, Any]:
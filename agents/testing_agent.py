@@ -2,12 +2,67 @@
 Testing & Quality Agent - Runs tests and validates code quality
 """
 
-import subprocess
+import io
 import os
 import sys
+import py_compile
+from collections import deque
+from contextlib import redirect_stdout, redirect_stderr
+from concurrent.futures import ProcessPoolExecutor
+import importlib.util
 from typing import Dict, Any, List, Optional
 from .base_agent import BaseAgent
 
+# Directories that never contain project tests but dominate traversal cost
+_SKIP_DIRS = frozenset({".git", "venv", "env", "ENV", "node_modules", "__pycache__"})
+
+# Lines of pytest output kept for the report; everything older is dropped
+_OUTPUT_TAIL_LINES = 1000
+
+# Cores actually available to this process, not the machine total
+try:
+    _CPU_COUNT = len(os.sched_getaffinity(0))
+except AttributeError:
+    _CPU_COUNT = os.cpu_count() or 1
+
+# Below this many changed files, process-pool spawn costs more than the
+# parallel compile saves
+_MIN_PARALLEL_FILES = 4
+
+def _compile_one(file_path: str):
+    """Compile one file to its cache entry; module-level so it pickles"""
+    try:
+        py_compile.compile(file_path, cfile=None, doraise=True)
+        return file_path, {"syntax_valid": True, "error": None}
+    except py_compile.PyCompileError as e:
+        return file_path, {"syntax_valid": False, "error": f"Syntax error: {str(e)}"}
+    except OSError as e:
+        return file_path, {"syntax_valid": False, "error": f"Unexpected error: {str(e)}"}
+
+class _TailBuffer(io.TextIOBase):
+    """Write sink that keeps only the last _OUTPUT_TAIL_LINES lines.
+
+    Large test suites can emit megabytes of -v output; a bounded deque
+    keeps memory flat while the report still shows the tail, which is
+    where pytest prints its failures and summary.
+    """
+
+    def __init__(self):
+        self._tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+        self._partial = ""
+
+    def writable(self):
+        return True
+
+    def write(self, s: str) -> int:
+        self._partial += s
+        *lines, self._partial = self._partial.split("\n")
+        self._tail.extend(line + "\n" for line in lines)
+        return len(s)
+
+    def getvalue(self) -> str:
+        return "".join(self._tail) + self._partial
+
 class TestingAgent(BaseAgent):
     """Agent responsible for testing and quality validation"""
     
@@ -34,13 +89,14 @@ class TestingAgent(BaseAgent):
             
             # Run syntax validation
             syntax_results = self._validate_syntax(files_to_test)
-            
-            # Run unit tests if they exist
-            test_results = self._run_tests()
-            
-            # Run integration tests if applicable
-            integration_results = self._run_integration_tests()
-            
+
+            # Both suites go through one in-process pytest invocation, so
+            # the import, plugin loading, and collection phase are paid once
+            unit_files, integration_files = self._discover_test_files()
+            test_results, integration_results = self._run_test_suites(
+                unit_files, integration_files
+            )
+
             # Compile results
             all_results = {
                 "syntax_validation": syntax_results,
@@ -66,118 +122,138 @@ class TestingAgent(BaseAgent):
         """Validate Python syntax"""
         results = {}
         
+        stale = []
         for file_path in files:
-            try:
-                with open(file_path, 'r') as f:
-                    code = f.read()
-                
-                # Try to compile the code
-                compile(code, file_path, 'exec')
+            # A __pycache__ entry at least as new as the source proves it
+            # compiled cleanly on a previous run; skip even the parse then.
+            # Compiling the rest writes bytecode the pytest run imports
+            # directly, so the same source is never parsed twice.
+            if self._bytecode_is_fresh(file_path):
                 results[file_path] = {"syntax_valid": True, "error": None}
-                
-            except SyntaxError as e:
-                results[file_path] = {
-                    "syntax_valid": False,
-                    "error": f"Syntax error: {str(e)}"
-                }
-            except Exception as e:
-                results[file_path] = {
-                    "syntax_valid": False,
-                    "error": f"Unexpected error: {str(e)}"
-                }
-        
+            else:
+                stale.append(file_path)
+
+        if len(stale) >= _MIN_PARALLEL_FILES:
+            # Compilation is CPU-bound, so changed files fan out over the
+            # cores this process is allowed to use
+            with ProcessPoolExecutor(max_workers=min(_CPU_COUNT, len(stale))) as executor:
+                results.update(executor.map(_compile_one, stale, chunksize=8))
+        else:
+            results.update(map(_compile_one, stale))
+
         return results
     
-    def _run_tests(self) -> Dict[str, Any]:
+    def _bytecode_is_fresh(self, file_path: str) -> bool:
+        """True when the cached bytecode is at least as new as the source"""
+        try:
+            cache_path = importlib.util.cache_from_source(file_path)
+            return os.stat(cache_path).st_mtime >= os.stat(file_path).st_mtime
+        except OSError:
+            return False
+
+    def _discover_test_files(self):
+        """Partition test files into unit and integration lists.
+
+        A single scandir-based traversal replaces the two full os.walk
+        passes the suites used to do independently: DirEntry type info
+        comes from the directory read itself (no per-entry stat), and
+        heavy non-source directories are pruned.
+        """
+        unit_files = []
+        integration_files = []
+        stack = ["."]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIP_DIRS:
+                                stack.append(entry.path)
+                        elif entry.name.endswith(".py") and entry.is_file():
+                            if entry.name.startswith("integration_test_"):
+                                integration_files.append(entry.path)
+                            elif entry.name.startswith("test_") or \
+                                    entry.name.endswith("_test.py"):
+                                unit_files.append(entry.path)
+            except OSError:
+                continue
+        return unit_files, integration_files
+
+    def _run_test_suites(self, unit_files: List[str],
+                         integration_files: List[str]):
+        """Run the unit and integration suites as one pytest invocation.
+
+        A single run shares one collection phase across all test files.
+        The combined result is reported under both suite keys; the overall
+        verdict only depends on the return code, which is the same whether
+        the suites run together or separately.
+        """
+        no_unit = {"status": "no_tests", "message": "No test files found"}
+        no_integration = {
+            "status": "no_integration_tests",
+            "message": "No integration tests found"
+        }
+
+        all_files = unit_files + integration_files
+        if not all_files:
+            return no_unit, no_integration
+
+        result = self._run_tests(all_files)
+        unit_result = dict(result, combined_run=True) if unit_files else no_unit
+        integration_result = (
+            dict(result, combined_run=True) if integration_files else no_integration
+        )
+        return unit_result, integration_result
+
+    def _run_pytest(self, test_files: List[str]) -> Dict[str, Any]:
+        """Run pytest in-process, reusing the already-warm interpreter.
+
+        pytest.main skips the interpreter startup and plugin loading a
+        python -m pytest subprocess pays per suite; output goes to
+        StringIO buffers so the result shape matches the old capture.
+        """
+        import pytest
+
+        buf_out, buf_err = _TailBuffer(), _TailBuffer()
+        with redirect_stdout(buf_out), redirect_stderr(buf_err):
+            return_code = pytest.main(["-v"] + test_files)
+
+        return {
+            "status": "completed",
+            "return_code": int(return_code),
+            "stdout": buf_out.getvalue(),
+            "stderr": buf_err.getvalue()
+        }
+
+    def _run_tests(self, test_files: List[str]) -> Dict[str, Any]:
         """Run unit tests"""
         try:
-            # Look for test files
-            test_files = self._find_test_files()
-            
             if not test_files:
                 return {"status": "no_tests", "message": "No test files found"}
-            
-            # Run pytest
-            result = subprocess.run(
-                ["python", "-m", "pytest", "-v"] + test_files,
-                capture_output=True,
-                text=True
-            )
-            
-            return {
-                "status": "completed",
-                "return_code": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr
-            }
-            
-        except FileNotFoundError:
+
+            return self._run_pytest(test_files)
+
+        except ImportError:
             return {"status": "pytest_not_found", "message": "pytest not available"}
         except Exception as e:
             return {"status": "error", "message": str(e)}
-    
-    def _find_test_files(self) -> List[str]:
-        """Find test files in the project"""
-        test_files = []
-        
-        # Look for common test file patterns
-        for root, dirs, files in os.walk("."):
-            for file in files:
-                if (file.startswith("test_") and file.endswith(".py")) or \
-                   (file.endswith("_test.py")):
-                    test_files.append(os.path.join(root, file))
-        
-        return test_files
-    
-    def _run_integration_tests(self) -> Dict[str, Any]:
-        """Run integration tests"""
-        try:
-            # Look for integration test files
-            integration_test_files = []
-            for root, dirs, files in os.walk("."):
-                for file in files:
-                    if file.startswith("integration_test_") and file.endswith(".py"):
-                        integration_test_files.append(os.path.join(root, file))
-            
-            if not integration_test_files:
-                return {"status": "no_integration_tests", "message": "No integration tests found"}
-            
-            # Run integration tests
-            result = subprocess.run(
-                ["python", "-m", "pytest", "-v"] + integration_test_files,
-                capture_output=True,
-                text=True
-            )
-            
-            return {
-                "status": "completed",
-                "return_code": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr
-            }
-            
-        except Exception as e:
-            return {"status": "error", "message": str(e)}
-    
+
     def _evaluate_results(self, results: Dict[str, Any]) -> bool:
         """Evaluate test results and determine overall success"""
-        # Check syntax validation
-        syntax_results = results.get("syntax_validation", {})
-        for file_path, result in syntax_results.items():
-            if not result.get("syntax_valid", False):
-                return False
-        
-        # Check unit tests
+        bad_syntax = any(
+            not r.get("syntax_valid", False)
+            for r in results.get("syntax_validation", {}).values()
+        )
         unit_tests = results.get("unit_tests", {})
-        if unit_tests.get("status") == "completed" and unit_tests.get("return_code") != 0:
-            return False
-        
-        # Check integration tests
         integration_tests = results.get("integration_tests", {})
-        if integration_tests.get("status") == "completed" and integration_tests.get("return_code") != 0:
-            return False
-        
-        return True
+        return not (
+            bad_syntax
+            or (unit_tests.get("status") == "completed"
+                and unit_tests.get("return_code") != 0)
+            or (integration_tests.get("status") == "completed"
+                and integration_tests.get("return_code") != 0)
+        )
     
     def generate_test_report(self, results: Dict[str, Any]) -> str:
         """Generate a human-readable test report"""
@@ -2,9 +2,18 @@
 Validator Agent - Final reviewer and approver
 """
 
+import re
 from typing import Dict, Any, List, Optional
 from .base_agent import BaseAgent
 
+# Deployment-blocking phrases, compiled once into a single alternation so
+# the critical-issue filter is one C-level scan per issue instead of six
+# lowered substring checks
+_CRITICAL_RE = re.compile(
+    r"syntax error|compilation failed|cannot run|broken|corrupted|security vulnerability",
+    re.IGNORECASE
+)
+
 class ValidatorAgent(BaseAgent):
     """Agent responsible for final validation and approval"""
     
@@ -22,6 +31,16 @@ class ValidatorAgent(BaseAgent):
             "ethics",
             "functionality"
         ]
+        # Bound-method table replaces the if/elif chain in
+        # _validate_criterion with a single dict probe
+        self._validators = {
+            "code_quality": self._validate_code_quality,
+            "documentation": self._validate_documentation,
+            "testing": self._validate_testing,
+            "security": self._validate_security,
+            "ethics": self._validate_ethics,
+            "functionality": self._validate_functionality
+        }
     
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute final validation"""
@@ -65,11 +84,8 @@ class ValidatorAgent(BaseAgent):
             # Only fail if there are actual critical errors that would prevent deployment
             if not result.get("passed", False) and result.get("issues"):
                 # Check if issues are critical deployment blockers
-                critical_issues = [issue for issue in result.get("issues", []) 
-                                 if any(keyword in issue.lower() for keyword in [
-                                     "syntax error", "compilation failed", "cannot run", 
-                                     "broken", "corrupted", "security vulnerability"
-                                 ])]
+                critical_issues = [issue for issue in result.get("issues", [])
+                                   if _CRITICAL_RE.search(issue)]
                 
                 if critical_issues:
                     validation["approved"] = False
@@ -83,34 +99,26 @@ class ValidatorAgent(BaseAgent):
     
     def _validate_criterion(self, criterion: str, validation_results: Dict[str, Any]) -> Dict[str, Any]:
         """Validate a specific criterion"""
-        if criterion == "code_quality":
-            return self._validate_code_quality(validation_results)
-        elif criterion == "documentation":
-            return self._validate_documentation(validation_results)
-        elif criterion == "testing":
-            return self._validate_testing(validation_results)
-        elif criterion == "security":
-            return self._validate_security(validation_results)
-        elif criterion == "ethics":
-            return self._validate_ethics(validation_results)
-        elif criterion == "functionality":
-            return self._validate_functionality(validation_results)
-        else:
+        validator = self._validators.get(criterion)
+        if validator is None:
             return {"passed": False, "issues": [f"Unknown criterion: {criterion}"]}
+        return validator(validation_results)
     
     def _validate_code_quality(self, validation_results: Dict[str, Any]) -> Dict[str, Any]:
         """Validate code quality"""
-        standards_results = validation_results.get("standards_results", {})
-        
+        standards_results = validation_results.get("standards_results")
+
         if not standards_results:
             # If no standards results, assume basic quality is acceptable
             return {"passed": True, "issues": [], "recommendations": ["Consider running code quality tools"]}
-        
-        issues = []
-        for tool, result in standards_results.items():
-            if result.get("status") != "clean":
-                issues.append(f"{tool}: {result.get('message', 'Issues found')}")
-        
+
+        # One pass over the items, built directly as a list
+        issues = [
+            f"{tool}: {result.get('message', 'Issues found')}"
+            for tool, result in standards_results.items()
+            if result.get("status") != "clean"
+        ]
+
         return {
             "passed": len(issues) == 0,
             "issues": issues,
@@ -119,8 +127,8 @@ class ValidatorAgent(BaseAgent):
     
     def _validate_documentation(self, validation_results: Dict[str, Any]) -> Dict[str, Any]:
         """Validate documentation"""
-        doc_results = validation_results.get("documentation_results", {})
-        
+        doc_results = validation_results.get("documentation_results")
+
         if not doc_results:
             # If no documentation results, assume basic documentation is acceptable
             return {"passed": True, "issues": [], "recommendations": ["Consider adding more documentation"]}
@@ -161,17 +169,18 @@ class ValidatorAgent(BaseAgent):
     
     def _validate_security(self, validation_results: Dict[str, Any]) -> Dict[str, Any]:
         """Validate security"""
-        security_results = validation_results.get("security_results", {})
-        
+        security_results = validation_results.get("security_results")
+
         if not security_results:
             # If no security results, assume basic security is acceptable
             return {"passed": True, "issues": [], "recommendations": ["Consider adding security scanning"]}
-        
-        issues = []
-        for file_path, result in security_results.items():
-            if not result.get("overall_safe", False):
-                issues.append(f"Security issues in {file_path}")
-        
+
+        issues = [
+            f"Security issues in {file_path}"
+            for file_path, result in security_results.items()
+            if not result.get("overall_safe", False)
+        ]
+
         return {
             "passed": len(issues) == 0,
             "issues": issues,
@@ -180,17 +189,18 @@ class ValidatorAgent(BaseAgent):
     
     def _validate_ethics(self, validation_results: Dict[str, Any]) -> Dict[str, Any]:
         """Validate ethics"""
-        ethics_results = validation_results.get("ethics_results", {})
-        
+        ethics_results = validation_results.get("ethics_results")
+
         if not ethics_results:
             # If no ethics results, assume basic ethics compliance is acceptable
             return {"passed": True, "issues": [], "recommendations": ["Consider adding ethics review"]}
-        
-        issues = []
-        for file_path, result in ethics_results.items():
-            if not result.get("overall_safe", False):
-                issues.append(f"Ethical issues in {file_path}")
-        
+
+        issues = [
+            f"Ethical issues in {file_path}"
+            for file_path, result in ethics_results.items()
+            if not result.get("overall_safe", False)
+        ]
+
         return {
             "passed": len(issues) == 0,
             "issues": issues,